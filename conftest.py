@@ -0,0 +1,50 @@
+import pytest
+from transport import LoopbackListener, LoopbackTransport
+
+
+@pytest.fixture
+def tk_display():
+    """
+    Skips the test unless Tk can open a window.
+    """
+    tk = pytest.importorskip('tkinter')
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        pytest.skip("no display available")
+
+
+@pytest.fixture
+def loopback_server(tk_display):
+    """
+    A TicTacToeServer wired to an in-process client, with host and port filled in.
+
+    Yields:
+        tuple[TicTacToeServer, LoopbackTransport]: The server and the client's end of the connection.
+    """
+    from player2 import TicTacToeServer
+
+    client_end, server_end = LoopbackTransport.pair()
+    server = TicTacToeServer(listen=lambda host, port: LoopbackListener(server_end))
+    server.host_entry.insert(0, 'loopback')
+    server.port_entry.insert(0, '0')
+    yield server, client_end
+    server.window.destroy()
+
+
+@pytest.fixture
+def loopback_client(tk_display):
+    """
+    A TicTacToeClient wired to an in-process server, with host and port filled in.
+
+    Yields:
+        tuple[TicTacToeClient, LoopbackTransport]: The client and the server's end of the connection.
+    """
+    from player1 import TicTacToeClient
+
+    client_end, server_end = LoopbackTransport.pair()
+    client = TicTacToeClient(connect=lambda host, port: client_end)
+    client.host_entry.insert(0, 'loopback')
+    client.port_entry.insert(0, '0')
+    yield client, server_end
+    client.window.destroy()
@@ -0,0 +1,83 @@
+import time
+from typing import Optional
+from gameboard import GameBoard
+
+# Every legal move on the wire is exactly two ASCII digits, row then column.
+# Looking the raw packet up in this table validates and decodes it in one
+# step, without decoding to str or calling int().
+MOVE_CELLS = {f"{row}{col}".encode(): (row, col) for row in range(3) for col in range(3)}
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for incoming packets on one connection.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initializes a new instance of the TokenBucket class.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (int): The maximum number of tokens the bucket can hold.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+
+    def allow(self) -> bool:
+        """
+        Takes one token from the bucket if one is available.
+
+        Returns:
+            bool: True if the packet may be processed, False if it should be dropped.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class MoveIngest:
+    """
+    Validates moves received from the opponent before they reach the GameBoard.
+
+    Legal moves are always accepted. Every rejected packet costs a token, and a
+    peer that runs the bucket dry is treated as hostile and must be disconnected,
+    which bounds the work a flooding peer can cause.
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: int = 10):
+        """
+        Initializes a new instance of the MoveIngest class.
+
+        Args:
+            rate (float): The number of rejected packets per second tolerated from the peer.
+            capacity (int): The number of rejected packets the peer may send in a burst.
+        """
+        self.bucket = TokenBucket(rate, capacity)
+
+    def parse(self, data: bytes, game_board: GameBoard) -> Optional[tuple[int, int]]:
+        """
+        Checks a raw move packet against the board and the rate limit.
+
+        Args:
+            data (bytes): The packet received from the peer.
+            game_board (GameBoard): The board the move would be played on.
+
+        Returns:
+            Optional[tuple[int, int]]: The row and column of a legal move, or None if the packet was rejected.
+
+        Raises:
+            ConnectionError: If the peer has sent too many rejected packets and should be disconnected.
+        """
+        cell = MOVE_CELLS.get(data)
+        if cell is not None and game_board.board[cell[0]][cell[1]] == ' ':
+            return cell
+        if not self.bucket.allow():
+            raise ConnectionError("peer exceeded the rejected-packet rate limit")
+        return None
@@ -1,13 +1,22 @@
-import socket
 import tkinter as tk
+from typing import Callable, Optional
 from gameboard import GameBoard
+from moves import MoveIngest
+from transport import SocketTransport, Transport
 
 class TicTacToeClient:
-    def __init__(self):
+    def __init__(self, connect: Callable[[str, int], Transport] = SocketTransport.connect_tcp):
         """
         Initializes the TicTacToeClient class.
+
+        Args:
+            connect (Callable[[str, int], Transport]): Opens the connection to the server from the
+                entered host and port. Defaults to TCP; bots and tests can pass a factory returning
+                a LoopbackTransport or Unix-domain SocketTransport instead.
         """
+        self.connect = connect
         self.server_socket = None
+        self.move_ingest = None
         self.window = None
         self.buttons = []
         self.game_board = GameBoard()
@@ -36,14 +45,45 @@ class TicTacToeClient:
         data = self.server_socket.recv(1024).decode()
         return data
 
+    def recv_move(self) -> Optional[tuple[int, int]]:
+        """
+        Receives the opponent's next legal move, dropping malformed or illegal packets.
+
+        Returns:
+            Optional[tuple[int, int]]: The row and column of the move, or None if the server disconnected
+            or was disconnected for flooding.
+        """
+        try:
+            while True:
+                data = self.server_socket.recv(1024)
+                if not data:
+                    break
+                move = self.move_ingest.parse(data, self.game_board)
+                if move is not None:
+                    return move
+        except OSError:
+            pass
+        self.disconnect()
+        return None
+
+    def disconnect(self):
+        """
+        Closes the connection after the server left or misbehaved.
+        """
+        self.server_socket.close()
+        for button in self.buttons:
+            button.config(state=tk.DISABLED)
+        self.turn_label.config(text="Player 2 disconnected.")
+        self.window.update()
+
     def connect_to_server(self):
         """
         Connects to the server using the provided host and port.
         """
         try:
             host, port = self.get_host_port()
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.connect((host, port))
+            self.server_socket = self.connect(host, port)
+            self.move_ingest = MoveIngest()
             self.connect_button.config(state=tk.DISABLED)
             self.username_entry.config(state=tk.NORMAL)
             self.username_button.config(state=tk.NORMAL)
@@ -157,28 +197,29 @@ class TicTacToeClient:
                         return
                 
         while self.turn == False:
-            move = self.recv()
-            if len(move) == 2:
-                self.game_board.update_game_board(int(move[0]), int(move[1]), 'O')
-                button = self.buttons[int(move[0]) * 3 + int(move[1])]
-                button.config(text='O', state=tk.DISABLED)
-                self.turn_label.config(text=f"{self.username}, please make your move...")
-                self.window.update()
-                self.turn = True
-                
-                if self.game_board.is_winner('O'):
-                    self.show_message("Player 2 wins!")
-                    self.game_board.num_losses()
-                    self.game_board.num_games()
-                    self.create_buttons()
-                    return
-
-                if self.game_board.board_is_full():
-                    self.show_message("Board is full!")
-                    self.game_board.num_ties()
-                    self.game_board.num_games()
-                    self.create_buttons()
-                    return
+            move = self.recv_move()
+            if move is None:
+                return
+            self.game_board.update_game_board(move[0], move[1], 'O')
+            button = self.buttons[move[0] * 3 + move[1]]
+            button.config(text='O', state=tk.DISABLED)
+            self.turn_label.config(text=f"{self.username}, please make your move...")
+            self.window.update()
+            self.turn = True
+
+            if self.game_board.is_winner('O'):
+                self.show_message("Player 2 wins!")
+                self.game_board.num_losses()
+                self.game_board.num_games()
+                self.create_buttons()
+                return
+
+            if self.game_board.board_is_full():
+                self.show_message("Board is full!")
+                self.game_board.num_ties()
+                self.game_board.num_games()
+                self.create_buttons()
+                return
 
     def start_game(self):
         """
@@ -1,18 +1,27 @@
-import socket
 import tkinter as tk
+from typing import Callable, Optional
 from gameboard import GameBoard
+from moves import MoveIngest
+from transport import Listener, SocketListener
 
 class TicTacToeServer:
     """
     Tic Tac Toe server class for hosting the game and managing the GUI.
     """
 
-    def __init__(self):
+    def __init__(self, listen: Callable[[str, int], Listener] = SocketListener.tcp):
         """
         Initialize the TicTacToeServer class.
+
+        Args:
+            listen (Callable[[str, int], Listener]): Starts listening on the entered host and
+                port. Defaults to TCP; bots and tests can pass a factory returning a LoopbackListener
+                or a Unix-domain SocketListener instead.
         """
+        self.listen = listen
         self.server_socket = None
         self.client_socket = None
+        self.move_ingest = None
         self.window = None
         self.buttons = []
         self.start_button = None
@@ -34,10 +43,43 @@ class TicTacToeServer:
         Receive a message from the client.
 
         Returns:
-            str: The received message.
+            str: The received message, or '' if the client disconnected or sent invalid text.
+        """
+        try:
+            return self.client_socket.recv(1024).decode()
+        except (OSError, UnicodeDecodeError):
+            return ''
+
+    def recv_move(self) -> Optional[tuple[int, int]]:
         """
-        data = self.client_socket.recv(1024).decode()
-        return data
+        Receive the client's next legal move, dropping malformed or illegal packets.
+
+        Returns:
+            Optional[tuple[int, int]]: The row and column of the move, or None if the client disconnected
+            or was disconnected for flooding.
+        """
+        try:
+            while True:
+                data = self.client_socket.recv(1024)
+                if not data:
+                    break
+                move = self.move_ingest.parse(data, self.game_board)
+                if move is not None:
+                    return move
+        except OSError:
+            pass
+        self.disconnect()
+        return None
+
+    def disconnect(self):
+        """
+        Close the connection after the client left or misbehaved.
+        """
+        self.client_socket.close()
+        self.server_socket.close()
+        self.disable_buttons()
+        self.turn_label.config(text="Player 1 disconnected.")
+        self.window.update()
 
     def get_host_port(self) -> tuple[str, int]:
         """
@@ -58,11 +100,10 @@ class TicTacToeServer:
             host, port = self.get_host_port()
             self.connect_button.config(state=tk.DISABLED)
             self.turn_label.config(text="Waiting for connection...")
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.bind((host, port))
+            self.server_socket = self.listen(host, port)
             self.window.update()
-            self.server_socket.listen(1)
-            self.client_socket, addr = self.server_socket.accept()
+            self.client_socket = self.server_socket.accept()
+            self.move_ingest = MoveIngest()
             self.turn_label.config(text="Connected! Waiting for Player 1 to enter their username...")
             self.window.update()
             self.game()
@@ -183,9 +224,11 @@ class TicTacToeServer:
                     return
 
         while not self.turn:
-            move = self.recv()
-            self.game_board.update_game_board(int(move[0]), int(move[1]), 'X')
-            button = self.buttons[int(move[0]) * 3 + int(move[1])]
+            move = self.recv_move()
+            if move is None:
+                return
+            self.game_board.update_game_board(move[0], move[1], 'X')
+            button = self.buttons[move[0] * 3 + move[1]]
             button.config(text='X', state=tk.DISABLED)
             self.turn_label.config(text="Player 2, please make your move.")
             self.window.update()
@@ -218,6 +261,7 @@ class TicTacToeServer:
         self.window.update()
 
         choice = self.recv()
+        fields = choice.split()
 
         if choice == "play_again":
             self.turn_label.config(text=f"Play Again! {self.username} is making a move...")
@@ -226,18 +270,21 @@ class TicTacToeServer:
             self.window.update()
             self.first_move()
 
-        elif choice[0] == "q":
-            choice = choice.split()
+        elif len(fields) == 5 and fields[0] == "q" and all(field.isdigit() for field in fields[1:]):
             popup.destroy()
             self.create_buttons()
-            self.num_games.config(text=choice[1])
-            self.num_wins.config(text=choice[3])
-            self.num_losses.config(text=choice[2])
-            self.num_ties.config(text=choice[4])
+            self.num_games.config(text=fields[1])
+            self.num_wins.config(text=fields[3])
+            self.num_losses.config(text=fields[2])
+            self.num_ties.config(text=fields[4])
             self.turn_label.config(text=f"Fun Times")
             self.server_socket.close()
             self.window.update()
 
+        else:
+            popup.destroy()
+            self.disconnect()
+
     def disable_buttons(self):
         """Disable all game buttons."""
         for button in self.buttons:
@@ -251,6 +298,9 @@ class TicTacToeServer:
     def game(self):
         """Start the game."""
         self.username = self.recv()
+        if not self.username:
+            self.disconnect()
+            return
         self.username_label_opponent.config(text=self.username)
         self.enable_buttons()
         self.turn_label.config(text=f"{self.username} is making a move...")
@@ -259,9 +309,11 @@ class TicTacToeServer:
 
     def first_move(self):
         """Handle the first move of the game."""
-        move = self.recv()
-        self.game_board.update_game_board(int(move[0]), int(move[1]), 'X')
-        button = self.buttons[int(move[0]) * 3 + int(move[1])]
+        move = self.recv_move()
+        if move is None:
+            return
+        self.game_board.update_game_board(move[0], move[1], 'X')
+        button = self.buttons[move[0] * 3 + move[1]]
         self.enable_buttons()
         button.config(text='X', state=tk.DISABLED)
         self.turn_label.config(text="Player 2, please make your move.")
@@ -0,0 +1,334 @@
+import argparse
+import collections
+import functools
+import gzip
+import multiprocessing
+import os
+import random
+from typing import Callable, Iterator
+from gameboard import GameBoard
+
+# A policy picks the next move for `player` on the given board.
+Policy = Callable[[GameBoard, str, random.Random], tuple[int, int]]
+
+CELLS = [(row, col) for row in range(3) for col in range(3)]
+
+
+def empty_cells(game_board: GameBoard) -> list[tuple[int, int]]:
+    """
+    Lists the cells that are still open.
+
+    Args:
+        game_board (GameBoard): The board to inspect.
+
+    Returns:
+        list[tuple[int, int]]: The row and column of every empty cell.
+    """
+    board = game_board.board
+    return [(row, col) for row, col in CELLS if board[row][col] == ' ']
+
+
+def random_policy(game_board: GameBoard, player: str, rng: random.Random) -> tuple[int, int]:
+    """
+    Plays a uniformly random legal move.
+    """
+    return rng.choice(empty_cells(game_board))
+
+
+def first_empty_policy(game_board: GameBoard, player: str, rng: random.Random) -> tuple[int, int]:
+    """
+    Plays the first open cell in row-major order.
+    """
+    return empty_cells(game_board)[0]
+
+
+_minimax_cache = {}
+
+
+def _minimax(game_board: GameBoard, player: str) -> tuple[int, list[tuple[int, int]]]:
+    """
+    Scores the position for the player to move and lists every best move.
+
+    Returns:
+        tuple[int, list[tuple[int, int]]]: 1 for a forced win, 0 for a draw, -1 for a forced loss, and the moves achieving it.
+    """
+    key = (''.join(''.join(row) for row in game_board.board), player)
+    cached = _minimax_cache.get(key)
+    if cached is not None:
+        return cached
+
+    opponent = 'O' if player == 'X' else 'X'
+    best_score = -2
+    best_moves = []
+    for row, col in empty_cells(game_board):
+        game_board.board[row][col] = player
+        if game_board.is_winner(player):
+            score = 1
+        elif game_board.board_is_full():
+            score = 0
+        else:
+            score = -_minimax(game_board, opponent)[0]
+        game_board.board[row][col] = ' '
+
+        if score > best_score:
+            best_score = score
+            best_moves = [(row, col)]
+        elif score == best_score:
+            best_moves.append((row, col))
+
+    _minimax_cache[key] = (best_score, best_moves)
+    return best_score, best_moves
+
+
+def minimax_policy(game_board: GameBoard, player: str, rng: random.Random) -> tuple[int, int]:
+    """
+    Plays perfectly, choosing at random among equally good moves.
+    """
+    return rng.choice(_minimax(game_board, player)[1])
+
+
+def epsilon_minimax_policy(game_board: GameBoard, player: str, rng: random.Random, epsilon: float = 0.1) -> tuple[int, int]:
+    """
+    Plays perfectly except for a random move with probability epsilon.
+    """
+    if rng.random() < epsilon:
+        return random_policy(game_board, player, rng)
+    return minimax_policy(game_board, player, rng)
+
+
+POLICIES: dict[str, Policy] = {
+    'random': random_policy,
+    'first': first_empty_policy,
+    'minimax': minimax_policy,
+    'epsilon': epsilon_minimax_policy,
+}
+
+
+def make_policy(name: str, epsilon: float = 0.1) -> Policy:
+    """
+    Looks up a policy by name and binds its parameters.
+
+    Args:
+        name (str): A key of POLICIES.
+        epsilon (float): The random-move probability used by the 'epsilon' policy.
+
+    Returns:
+        Policy: The ready-to-play policy.
+    """
+    policy = POLICIES[name]
+    if policy is epsilon_minimax_policy:
+        return functools.partial(policy, epsilon=epsilon)
+    return policy
+
+
+def play_game(game_board: GameBoard, policy_x: Policy, policy_o: Policy, rng: random.Random) -> tuple[list[tuple[str, str, int]], str]:
+    """
+    Plays one game from an empty board, X moving first.
+
+    Args:
+        game_board (GameBoard): The board to play on; it is reset first.
+        policy_x (Policy): The policy playing X.
+        policy_o (Policy): The policy playing O.
+        rng (random.Random): The random source handed to both policies.
+
+    Returns:
+        tuple[list[tuple[str, str, int]], str]: Each position as (board, player to move, chosen cell 0-8),
+        and the outcome: 'X' or 'O' for the winner, 'T' for a tie.
+    """
+    game_board.reset_game_board()
+    positions = []
+    player, policy = 'X', policy_x
+    while True:
+        state = ''.join(''.join(row) for row in game_board.board).replace(' ', '.')
+        row, col = policy(game_board, player, rng)
+        game_board.update_game_board(row, col, player)
+        positions.append((state, player, row * 3 + col))
+
+        if game_board.is_winner(player):
+            return positions, player
+        if game_board.board_is_full():
+            return positions, 'T'
+
+        if player == 'X':
+            player, policy = 'O', policy_o
+        else:
+            player, policy = 'X', policy_x
+
+
+def play_batch(task: tuple[str, str, float, int, int]) -> tuple[bytes, int]:
+    """
+    Plays a batch of games and encodes every position as one text record.
+
+    Records are 'board,player,cell,outcome' lines, with '.' for empty cells.
+
+    Args:
+        task (tuple[str, str, float, int, int]): The X policy name, O policy name, epsilon, number of games and seed.
+
+    Returns:
+        tuple[bytes, int]: The encoded records and the number of positions they hold.
+    """
+    name_x, name_o, epsilon, num_games, seed = task
+    policy_x, policy_o = make_policy(name_x, epsilon), make_policy(name_o, epsilon)
+    rng = random.Random(seed)
+    game_board = GameBoard()
+    lines = []
+    for _ in range(num_games):
+        positions, outcome = play_game(game_board, policy_x, policy_o, rng)
+        for state, player, cell in positions:
+            lines.append(f"{state},{player},{cell},{outcome}\n")
+    return ''.join(lines).encode(), len(lines)
+
+
+def generate(name_x: str, name_o: str, num_games: int, batch_size: int = 2000, workers: int = 0, seed: int = 0, epsilon: float = 0.1) -> Iterator[tuple[bytes, int]]:
+    """
+    Plays num_games across worker processes and yields encoded batches in order.
+
+    At most two batches per worker are in flight at once, so memory stays bounded
+    however many games are requested and however slowly the consumer writes.
+
+    Args:
+        name_x (str): The policy playing X.
+        name_o (str): The policy playing O.
+        num_games (int): The total number of games to play.
+        batch_size (int): The number of games per worker task.
+        workers (int): The number of worker processes; 0 uses every CPU.
+        seed (int): The base seed; each batch gets an independent 64-bit seed drawn from it.
+        epsilon (float): The random-move probability used by the 'epsilon' policy.
+
+    Returns:
+        Iterator[tuple[bytes, int]]: The encoded records of each batch and its position count.
+
+    Raises:
+        ValueError: If a policy name is unknown or a numeric argument is out of range.
+    """
+    for name in (name_x, name_o):
+        if name not in POLICIES:
+            raise ValueError(f"Unknown policy {name!r}; choose from {', '.join(POLICIES)}.")
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}.")
+    if workers < 0:
+        raise ValueError(f"workers must not be negative, got {workers}.")
+    if num_games < 0:
+        raise ValueError(f"num_games must not be negative, got {num_games}.")
+    if not 0 <= epsilon <= 1:
+        raise ValueError(f"epsilon must be between 0 and 1, got {epsilon}.")
+
+    return _generate(name_x, name_o, num_games, batch_size, workers or os.cpu_count() or 1, seed, epsilon)
+
+
+def batch_seeds(seed: int) -> Iterator[int]:
+    """
+    Yields independent per-batch seeds, so runs with neighbouring base seeds share no games.
+
+    Args:
+        seed (int): The base seed.
+
+    Yields:
+        int: A 64-bit seed for each batch in turn.
+    """
+    seeder = random.Random(seed)
+    while True:
+        yield seeder.getrandbits(64)
+
+
+def _generate(name_x: str, name_o: str, num_games: int, batch_size: int, workers: int, seed: int, epsilon: float) -> Iterator[tuple[bytes, int]]:
+    """
+    Runs the worker pool for generate() once its arguments have been checked.
+    """
+    tasks = ((name_x, name_o, epsilon, min(batch_size, num_games - start), batch_seed)
+             for start, batch_seed in zip(range(0, num_games, batch_size), batch_seeds(seed)))
+
+    with multiprocessing.Pool(workers) as pool:
+        in_flight = collections.deque()
+        for task in tasks:
+            in_flight.append(pool.apply_async(play_batch, (task,)))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().get()
+        while in_flight:
+            yield in_flight.popleft().get()
+
+
+def write_shards(batches: Iterator[tuple[bytes, int]], out_dir: str, positions_per_shard: int = 1_000_000, compresslevel: int = 1) -> int:
+    """
+    Streams batches into gzip-compressed shard files, starting a new shard once
+    the current one holds positions_per_shard positions.
+
+    Each shard is written under a hidden temporary name and renamed to
+    shard-NNNNN.csv.gz only once it is complete, so a crashed run never leaves
+    a truncated file that looks like a finished shard.
+
+    Args:
+        batches (Iterator[tuple[bytes, int]]): The batches produced by generate().
+        out_dir (str): The directory the shards are written to.
+        positions_per_shard (int): The number of positions after which a shard is closed.
+        compresslevel (int): The gzip compression level.
+
+    Returns:
+        int: The total number of positions written.
+
+    Raises:
+        ValueError: If positions_per_shard is not positive or out_dir already holds shards.
+    """
+    if positions_per_shard <= 0:
+        raise ValueError(f"positions_per_shard must be positive, got {positions_per_shard}.")
+    os.makedirs(out_dir, exist_ok=True)
+    existing = [name for name in os.listdir(out_dir) if name.startswith(('shard-', '.shard-'))]
+    if existing:
+        raise ValueError(f"{out_dir} already holds shard files from an earlier run; choose an empty directory.")
+
+    total = 0
+    shard_index = 0
+    shard_positions = 0
+    shard = None
+    try:
+        for data, count in batches:
+            if shard is None:
+                name = f"shard-{shard_index:05d}.csv.gz"
+                temp_path = os.path.join(out_dir, f".{name}.tmp")
+                shard = gzip.open(temp_path, 'wb', compresslevel=compresslevel)
+            shard.write(data)
+            shard_positions += count
+            total += count
+            if shard_positions >= positions_per_shard:
+                shard.close()
+                shard = None
+                os.replace(temp_path, os.path.join(out_dir, name))
+                shard_index += 1
+                shard_positions = 0
+        if shard is not None:
+            shard.close()
+            shard = None
+            os.replace(temp_path, os.path.join(out_dir, name))
+    finally:
+        if shard is not None:
+            shard.close()
+            os.unlink(temp_path)
+    return total
+
+
+def main():
+    """
+    Command-line entry point for generating self-play data.
+    """
+    parser = argparse.ArgumentParser(description="Generate tic-tac-toe self-play training data.")
+    parser.add_argument('out_dir', help="directory to write shard files to")
+    parser.add_argument('--games', type=int, default=100_000, help="number of games to play")
+    parser.add_argument('--x', default='random', choices=POLICIES, help="policy playing X")
+    parser.add_argument('--o', default='random', choices=POLICIES, help="policy playing O")
+    parser.add_argument('--workers', type=int, default=0, help="worker processes (default: all CPUs)")
+    parser.add_argument('--batch-size', type=int, default=2000, help="games per worker task")
+    parser.add_argument('--shard-size', type=int, default=1_000_000, help="positions per shard file")
+    parser.add_argument('--seed', type=int, default=0, help="base random seed")
+    parser.add_argument('--epsilon', type=float, default=0.1, help="random-move probability of the epsilon policy")
+    args = parser.parse_args()
+
+    try:
+        batches = generate(args.x, args.o, args.games, args.batch_size, args.workers, args.seed, args.epsilon)
+        total = write_shards(batches, args.out_dir, args.shard_size)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"Wrote {total} positions from {args.games} games to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
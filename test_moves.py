@@ -0,0 +1,104 @@
+import pytest
+import moves
+from gameboard import GameBoard
+from moves import MOVE_CELLS, MoveIngest, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(moves.time, 'monotonic', fake)
+    return fake
+
+
+def test_move_cells_cover_the_board():
+    assert len(MOVE_CELLS) == 9
+    assert MOVE_CELLS[b'00'] == (0, 0)
+    assert MOVE_CELLS[b'21'] == (2, 1)
+
+
+def test_token_bucket_capacity(clock):
+    bucket = TokenBucket(rate=1.0, capacity=3)
+    assert [bucket.allow() for _ in range(4)] == [True, True, True, False]
+
+
+def test_token_bucket_refill_is_capped(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2)
+    bucket.allow()
+    bucket.allow()
+    assert not bucket.allow()
+    clock.now = 0.5
+    assert bucket.allow()
+    assert not bucket.allow()
+    clock.now = 100.0
+    assert [bucket.allow() for _ in range(3)] == [True, True, False]
+
+
+@pytest.mark.parametrize('data', [b'', b'9', b'99', b'1', b'110', b'ab', b'\xff\xfe', b'1 1'])
+def test_parse_rejects_malformed(clock, data):
+    assert MoveIngest().parse(data, GameBoard()) is None
+
+
+def test_parse_rejects_occupied_cell(clock):
+    game_board = GameBoard()
+    game_board.update_game_board(1, 1, 'X')
+    assert MoveIngest().parse(b'11', game_board) is None
+    assert MoveIngest().parse(b'02', game_board) == (0, 2)
+
+
+def test_parse_accepts_legal_move_after_rejections(clock):
+    ingest = MoveIngest(rate=1.0, capacity=3)
+    game_board = GameBoard()
+    for _ in range(3):
+        assert ingest.parse(b'99', game_board) is None
+    assert ingest.parse(b'22', game_board) == (2, 2)
+
+
+def test_parse_raises_when_flooded(clock):
+    ingest = MoveIngest(rate=1.0, capacity=3)
+    game_board = GameBoard()
+    for _ in range(3):
+        ingest.parse(b'99', game_board)
+    with pytest.raises(ConnectionError):
+        ingest.parse(b'99', game_board)
+
+
+def test_server_disconnects_on_invalid_username(loopback_server):
+    server, client_end = loopback_server
+    client_end.send(b'\xff\xfe')
+    server.connect_to_server()
+    assert server.turn_label['text'] == "Player 1 disconnected."
+
+
+def test_server_disconnects_flooding_client(loopback_server):
+    server, client_end = loopback_server
+    client_end.send(b'alice')
+    for _ in range(100):
+        client_end.send(b'99')
+    server.connect_to_server()
+    assert server.turn_label['text'] == "Player 1 disconnected."
+    assert client_end.recv() == b''
+
+
+def test_client_disconnects_flooding_server(loopback_client):
+    client, server_end = loopback_client
+    client.connect_to_server()
+    client.username_entry.insert(0, 'alice')
+    client.start_game()
+    for _ in range(100):
+        server_end.send(b'99')
+    client.handle_move(0, 0)
+
+    assert client.turn_label['text'] == "Player 2 disconnected."
+    assert client.server_socket.closed
+    assert server_end.recv() == b'alice'
+    assert server_end.recv() == b'00'
+    assert server_end.recv() == b''
@@ -0,0 +1,117 @@
+import gzip
+import random
+import pytest
+from gameboard import GameBoard
+from selfplay import batch_seeds, generate, make_policy, play_batch, play_game, write_shards
+
+
+@pytest.mark.parametrize('opponent', ['random', 'first', 'minimax'])
+def test_minimax_never_loses(opponent):
+    rng = random.Random(0)
+    game_board = GameBoard()
+    minimax, other = make_policy('minimax'), make_policy(opponent)
+    for _ in range(200):
+        _, outcome = play_game(game_board, minimax, other, rng)
+        assert outcome != 'O'
+        _, outcome = play_game(game_board, other, minimax, rng)
+        assert outcome != 'X'
+
+
+def test_minimax_self_play_always_ties():
+    rng = random.Random(1)
+    minimax = make_policy('minimax')
+    for _ in range(100):
+        assert play_game(GameBoard(), minimax, minimax, rng)[1] == 'T'
+
+
+def test_play_game_records_every_move():
+    positions, outcome = play_game(GameBoard(), make_policy('first'), make_policy('first'), random.Random(0))
+    assert [cell for _, _, cell in positions] == [0, 1, 2, 3, 4, 5, 6]
+    assert [player for _, player, _ in positions] == ['X', 'O'] * 3 + ['X']
+    assert positions[0][0] == '.........'
+    assert positions[-1][0] == 'XOXOXO...'
+    assert outcome == 'X'
+
+
+def test_epsilon_is_configurable():
+    rng = random.Random(2)
+    game_board = GameBoard()
+    perfect = make_policy('epsilon', epsilon=0.0)
+    for _ in range(100):
+        assert play_game(game_board, perfect, perfect, rng)[1] == 'T'
+    noisy = make_policy('epsilon', epsilon=1.0)
+    outcomes = {play_game(game_board, noisy, noisy, rng)[1] for _ in range(200)}
+    assert outcomes == {'X', 'O', 'T'}
+
+
+def test_play_batch_encodes_records():
+    data, count = play_batch(('random', 'random', 0.1, 10, 3))
+    lines = data.decode().splitlines()
+    assert len(lines) == count
+    for line in lines:
+        board, player, cell, outcome = line.split(',')
+        assert len(board) == 9 and board[int(cell)] == '.'
+        assert player in 'XO' and outcome in 'XOT'
+
+
+def test_batch_seeds_do_not_overlap_between_base_seeds():
+    first = batch_seeds(0)
+    second = batch_seeds(1)
+    seeds_0 = [next(first) for _ in range(100)]
+    seeds_1 = [next(second) for _ in range(100)]
+    assert len(set(seeds_0)) == 100
+    assert not set(seeds_0) & set(seeds_1)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'name_x': 'nope'},
+    {'batch_size': 0},
+    {'num_games': -1},
+    {'workers': -1},
+    {'epsilon': 1.5},
+])
+def test_generate_rejects_bad_arguments(kwargs):
+    args = {'name_x': 'random', 'name_o': 'random', 'num_games': 10, **kwargs}
+    with pytest.raises(ValueError):
+        generate(**args)
+
+
+def test_generate_is_reproducible():
+    batches = list(generate('random', 'epsilon', 25, batch_size=10, workers=1, seed=7))
+    assert [count > 0 for _, count in batches] == [True, True, True]
+    assert batches == list(generate('random', 'epsilon', 25, batch_size=10, workers=1, seed=7))
+    assert batches != list(generate('random', 'epsilon', 25, batch_size=10, workers=1, seed=8))
+
+
+def test_write_shards_rotates(tmp_path):
+    batches = [(f"batch{i}\n".encode(), 4) for i in range(5)]
+    total = write_shards(iter(batches), str(tmp_path), positions_per_shard=8)
+    assert total == 20
+    shards = sorted(tmp_path.iterdir())
+    assert [shard.name for shard in shards] == ['shard-00000.csv.gz', 'shard-00001.csv.gz', 'shard-00002.csv.gz']
+    contents = [gzip.open(shard).read() for shard in shards]
+    assert contents == [b'batch0\nbatch1\n', b'batch2\nbatch3\n', b'batch4\n']
+
+
+def test_write_shards_rejects_non_positive_shard_size(tmp_path):
+    with pytest.raises(ValueError):
+        write_shards(iter([]), str(tmp_path), positions_per_shard=0)
+
+
+def test_write_shards_refuses_directory_with_earlier_shards(tmp_path):
+    write_shards(iter([(b'old\n', 1)] * 3), str(tmp_path), positions_per_shard=1)
+    with pytest.raises(ValueError):
+        write_shards(iter([(b'new\n', 1)]), str(tmp_path), positions_per_shard=1)
+    assert [gzip.open(shard).read() for shard in sorted(tmp_path.iterdir())] == [b'old\n'] * 3
+
+
+def test_write_shards_leaves_only_complete_shards_on_failure(tmp_path):
+    def failing_batches():
+        for i in range(3):
+            yield f"batch{i}\n".encode(), 4
+        raise RuntimeError("worker died")
+
+    with pytest.raises(RuntimeError):
+        write_shards(failing_batches(), str(tmp_path), positions_per_shard=6)
+    assert [shard.name for shard in tmp_path.iterdir()] == ['shard-00000.csv.gz']
+    assert gzip.open(tmp_path / 'shard-00000.csv.gz').read() == b'batch0\nbatch1\n'
@@ -0,0 +1,119 @@
+import os
+import socket
+import threading
+import pytest
+from transport import Listener, LoopbackListener, LoopbackTransport, SocketListener, SocketTransport, Transport
+
+
+def test_base_classes_are_abstract():
+    with pytest.raises(TypeError):
+        Transport()
+    with pytest.raises(TypeError):
+        Listener()
+
+
+def test_loopback_round_trip():
+    a, b = LoopbackTransport.pair()
+    a.send(b'11')
+    b.send(b'22')
+    assert b.recv() == b'11'
+    assert a.recv() == b'22'
+
+
+def test_loopback_splits_long_messages():
+    a, b = LoopbackTransport.pair()
+    a.send(b'hello')
+    assert b.recv(2) == b'he'
+    assert b.recv(2) == b'll'
+    assert b.recv(2) == b'o'
+
+
+def test_loopback_eof_after_queued_data():
+    a, b = LoopbackTransport.pair()
+    a.send(b'00')
+    a.close()
+    assert b.recv() == b'00'
+    assert b.recv() == b''
+    assert b.recv() == b''
+
+
+def test_loopback_can_send_after_peer_closes():
+    a, b = LoopbackTransport.pair()
+    a.close()
+    assert b.recv() == b''
+    b.send(b'bye')
+    assert a.inbox.get() == b'bye'
+
+
+def test_loopback_send_after_local_close_raises():
+    a, _ = LoopbackTransport.pair()
+    a.close()
+    with pytest.raises(OSError):
+        a.send(b'00')
+
+
+def test_loopback_listener_hands_out_endpoint():
+    a, b = LoopbackTransport.pair()
+    listener = LoopbackListener(b)
+    assert listener.accept() is b
+    listener.close()
+
+
+def _exchange(listener: SocketListener, connect):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(listener.accept().recv()))
+    thread.start()
+    client = connect()
+    client.send(b'12')
+    thread.join(timeout=5)
+    client.close()
+    listener.close()
+    return result
+
+
+def test_tcp_exchange():
+    listener = SocketListener.tcp('127.0.0.1', 0)
+    port = listener.sock.getsockname()[1]
+    assert _exchange(listener, lambda: SocketTransport.connect_tcp('127.0.0.1', port)) == [b'12']
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="Unix-domain sockets unavailable")
+def test_unix_exchange(tmp_path):
+    path = str(tmp_path / 'tictactoe.sock')
+    listener = SocketListener.unix(path)
+    assert _exchange(listener, lambda: SocketTransport.connect_unix(path)) == [b'12']
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="Unix-domain sockets unavailable")
+def test_unix_listener_can_rebind_same_path(tmp_path):
+    path = str(tmp_path / 'tictactoe.sock')
+    SocketListener.unix(path).close()
+    assert not os.path.exists(path)
+
+    # A socket file left behind by a listener that was never closed is replaced.
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    listener = SocketListener.unix(path)
+    assert _exchange(listener, lambda: SocketTransport.connect_unix(path)) == [b'12']
+    assert not os.path.exists(path)
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="Unix-domain sockets unavailable")
+def test_unix_listener_keeps_regular_files(tmp_path):
+    path = tmp_path / 'not-a-socket'
+    path.write_text('data')
+    with pytest.raises(OSError):
+        SocketListener.unix(str(path))
+    assert path.read_text() == 'data'
+
+
+def test_server_plays_first_move_over_loopback(loopback_server):
+    server, client_end = loopback_server
+    client_end.send(b'alice')
+    client_end.send(b'11')
+    server.connect_to_server()
+
+    assert server.username == 'alice'
+    assert server.game_board.board[1][1] == 'X'
+    assert server.turn is True
@@ -0,0 +1,347 @@
+import os
+import queue
+import socket
+import stat
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class Transport(ABC):
+    """
+    Base class for the byte stream connecting the two players.
+    """
+
+    @abstractmethod
+    def send(self, message: bytes):
+        """
+        Sends raw bytes to the peer.
+
+        Args:
+            message (bytes): The bytes to send.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def recv(self, bufsize: int = 1024) -> bytes:
+        """
+        Receives up to bufsize bytes from the peer.
+
+        Args:
+            bufsize (int): The maximum number of bytes to return.
+
+        Returns:
+            bytes: The received bytes, or b'' once the peer has closed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self):
+        """
+        Closes the transport.
+        """
+        raise NotImplementedError
+
+
+class Listener(ABC):
+    """
+    Base class for the hosting side, which waits for the other player to connect.
+    """
+
+    @abstractmethod
+    def accept(self) -> Transport:
+        """
+        Blocks until a peer connects.
+
+        Returns:
+            Transport: The transport for the accepted peer.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self):
+        """
+        Stops listening for new connections.
+        """
+        raise NotImplementedError
+
+
+class SocketTransport(Transport):
+    """
+    Transport backed by a connected stream socket (TCP or Unix-domain).
+    """
+
+    def __init__(self, sock: socket.socket):
+        """
+        Initializes a new instance of the SocketTransport class.
+
+        Args:
+            sock (socket.socket): A connected stream socket.
+        """
+        self.sock = sock
+
+    @classmethod
+    def connect_tcp(cls, host: str, port: int) -> 'SocketTransport':
+        """
+        Opens a TCP connection to the given host and port.
+
+        Args:
+            host (str): The host to connect to.
+            port (int): The port to connect to.
+
+        Returns:
+            SocketTransport: The connected transport.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.connect((host, port))
+        except Exception:
+            sock.close()
+            raise
+        return cls(sock)
+
+    @classmethod
+    def connect_unix(cls, path: str) -> 'SocketTransport':
+        """
+        Opens a Unix-domain socket connection to the given path.
+
+        Args:
+            path (str): The filesystem path of the listening socket.
+
+        Returns:
+            SocketTransport: The connected transport.
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(path)
+        except Exception:
+            sock.close()
+            raise
+        return cls(sock)
+
+    def send(self, message: bytes):
+        """
+        Sends all of the given bytes over the socket.
+
+        Args:
+            message (bytes): The bytes to send.
+        """
+        self.sock.sendall(message)
+
+    def recv(self, bufsize: int = 1024) -> bytes:
+        """
+        Receives up to bufsize bytes from the socket.
+
+        Args:
+            bufsize (int): The maximum number of bytes to return.
+
+        Returns:
+            bytes: The received bytes, or b'' once the peer has closed.
+        """
+        return self.sock.recv(bufsize)
+
+    def close(self):
+        """
+        Closes the socket.
+        """
+        self.sock.close()
+
+
+class SocketListener(Listener):
+    """
+    Listening socket that hands out a SocketTransport per accepted peer.
+    """
+
+    def __init__(self, sock: socket.socket, path: Optional[str] = None):
+        """
+        Initializes a new instance of the SocketListener class.
+
+        Args:
+            sock (socket.socket): A bound and listening stream socket.
+            path (Optional[str]): The Unix-domain socket file to remove on close, if any.
+        """
+        self.sock = sock
+        self.path = path
+
+    @classmethod
+    def tcp(cls, host: str, port: int, backlog: int = 1) -> 'SocketListener':
+        """
+        Binds and listens on the given TCP host and port.
+
+        Args:
+            host (str): The host to bind to.
+            port (int): The port to bind to.
+            backlog (int): The number of pending connections to queue.
+
+        Returns:
+            SocketListener: The listening socket.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.bind((host, port))
+            sock.listen(backlog)
+        except Exception:
+            sock.close()
+            raise
+        return cls(sock)
+
+    @classmethod
+    def unix(cls, path: str, backlog: int = 1) -> 'SocketListener':
+        """
+        Binds and listens on the given Unix-domain socket path.
+
+        A socket file left behind at the path by an earlier listener is removed
+        first; any other kind of file there is left alone and makes the bind fail.
+
+        Args:
+            path (str): The filesystem path to bind to.
+            backlog (int): The number of pending connections to queue.
+
+        Returns:
+            SocketListener: The listening socket.
+        """
+        try:
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(path)
+            sock.listen(backlog)
+        except Exception:
+            sock.close()
+            raise
+        return cls(sock, path)
+
+    def accept(self) -> SocketTransport:
+        """
+        Blocks until a peer connects.
+
+        Returns:
+            SocketTransport: The transport for the accepted peer.
+        """
+        sock, _ = self.sock.accept()
+        return SocketTransport(sock)
+
+    def close(self):
+        """
+        Stops listening for new connections and removes the Unix-domain socket file, if any.
+        """
+        self.sock.close()
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+
+
+class LoopbackTransport(Transport):
+    """
+    In-process transport backed by a pair of queues, for bots and tests that
+    run both players in one process without any socket syscalls.
+
+    As with a stream socket, an end can keep sending after its peer has
+    closed; only closing the local end stops it from sending.
+    """
+
+    def __init__(self, inbox: queue.SimpleQueue, outbox: queue.SimpleQueue):
+        """
+        Initializes a new instance of the LoopbackTransport class.
+
+        Args:
+            inbox (queue.SimpleQueue): The queue this end reads from.
+            outbox (queue.SimpleQueue): The queue the peer reads from.
+        """
+        self.inbox = inbox
+        self.outbox = outbox
+        self.pending = b''
+        self.closed = False
+        self.peer_closed = False
+
+    @classmethod
+    def pair(cls) -> tuple['LoopbackTransport', 'LoopbackTransport']:
+        """
+        Creates two connected loopback endpoints.
+
+        Returns:
+            tuple[LoopbackTransport, LoopbackTransport]: The two endpoints.
+        """
+        a_to_b = queue.SimpleQueue()
+        b_to_a = queue.SimpleQueue()
+        return cls(b_to_a, a_to_b), cls(a_to_b, b_to_a)
+
+    def send(self, message: bytes):
+        """
+        Queues the given bytes for the peer.
+
+        Args:
+            message (bytes): The bytes to send.
+
+        Raises:
+            OSError: If this end has been closed.
+        """
+        if self.closed:
+            raise OSError("send on closed transport")
+        if message:
+            self.outbox.put(bytes(message))
+
+    def recv(self, bufsize: int = 1024) -> bytes:
+        """
+        Receives up to bufsize bytes from the peer, blocking until some arrive.
+
+        A message longer than bufsize is handed out over several calls.
+
+        Args:
+            bufsize (int): The maximum number of bytes to return.
+
+        Returns:
+            bytes: The received bytes, or b'' once either end has closed.
+        """
+        if not self.pending:
+            if self.closed or self.peer_closed:
+                return b''
+            self.pending = self.inbox.get()
+            if not self.pending:
+                self.peer_closed = True
+                return b''
+        data, self.pending = self.pending[:bufsize], self.pending[bufsize:]
+        return data
+
+    def close(self):
+        """
+        Closes this end; the peer sees b'' once it has read everything queued before.
+        """
+        if not self.closed:
+            self.closed = True
+            self.outbox.put(b'')
+
+
+class LoopbackListener(Listener):
+    """
+    Listener stand-in that hands out one pre-connected loopback endpoint, so a
+    hosting player can be wired to an in-process peer.
+    """
+
+    def __init__(self, transport: LoopbackTransport):
+        """
+        Initializes a new instance of the LoopbackListener class.
+
+        Args:
+            transport (LoopbackTransport): The endpoint returned by accept().
+        """
+        self.transport = transport
+
+    def accept(self) -> LoopbackTransport:
+        """
+        Returns the pre-connected endpoint.
+
+        Returns:
+            LoopbackTransport: The endpoint given to the constructor.
+        """
+        return self.transport
+
+    def close(self):
+        """
+        Does nothing; there is no listening socket to close.
+        """